@@ -0,0 +1,103 @@
+# file_organizer/_classify.py
+import bisect
+import os
+import time
+
+# Width in seconds of the buckets used to cache date folder names. Most UTC
+# offsets are whole quarter hours, so nearly every bucket lies within one
+# local calendar day. A bucket that spans local midnight (e.g. under the
+# -0:44:30 offset Africa/Monrovia used until 1972) is not cached.
+DATE_CACHE_SECONDS = 900
+
+# Size buckets: a file belongs to SIZE_NAMES[i] when it is smaller than
+# SIZE_BOUNDS[i] and at least SIZE_BOUNDS[i - 1].
+SIZE_BOUNDS = (
+    1_024,  # Tiny: < 1 KB
+    1_048_576,  # Small: 1 KB - 1 MB
+    134_217_728,  # Medium: 1 MB - 128 MB
+    1_073_741_824,  # Large: 128 MB - 1 GB
+)
+SIZE_NAMES = ("Tiny", "Small", "Medium", "Large", "Huge")  # Huge: > 1 GB
+
+
+def ext_key(ext_template: str):
+    """Returns a classifier naming the folder for a file's extension, or
+    None for files without one."""
+    folder_cache = {}
+
+    def classify(entry):
+        head, _, extension = entry.name.rpartition(".")
+        if not (head and extension):
+            return None
+        dest_dir_name = folder_cache.get(extension)
+        if dest_dir_name is None:
+            dest_dir_name = ext_template.format(ext=extension.lower())
+            folder_cache[extension] = dest_dir_name
+        return dest_dir_name
+
+    return classify
+
+
+def _strftime_format(date_template: str):
+    """Translates a date template built only from the {YYYY}, {MM} and {DD}
+    fields into a time.strftime format, or returns None if it uses anything
+    else that needs str.format."""
+    strf = date_template.replace("%", "%%")
+    for field, directive in (("{YYYY}", "%Y"), ("{MM}", "%m"), ("{DD}", "%d")):
+        strf = strf.replace(field, directive)
+    if "{" in strf or "}" in strf:
+        return None
+    return strf
+
+
+def date_key(date_template: str):
+    """Returns a classifier naming the folder for a file's modification
+    date."""
+    strf = _strftime_format(date_template)
+    day_cache = {}
+
+    def classify(entry):
+        m_time = entry.stat(follow_symlinks=False).st_mtime
+        day_key = int(m_time // DATE_CACHE_SECONDS)
+        dest_dir_name = day_cache.get(day_key)
+        if dest_dir_name is None:
+            tm = time.localtime(m_time)
+            if strf is not None:
+                dest_dir_name = time.strftime(strf, tm)
+            else:
+                dest_dir_name = date_template.format(
+                    YYYY=tm.tm_year,
+                    MM=f"{tm.tm_mon:02}",
+                    DD=f"{tm.tm_mday:02}",
+                )
+            start = day_key * DATE_CACHE_SECONDS
+            end = start + DATE_CACHE_SECONDS - 1
+            if time.localtime(start)[:3] == time.localtime(end)[:3]:
+                day_cache[day_key] = dest_dir_name
+        return dest_dir_name
+
+    return classify
+
+
+def size_key(size_template: str):
+    """Returns a classifier naming the folder for a file's size bucket."""
+    folders = [size_template.format(size=name) for name in SIZE_NAMES]
+
+    def classify(entry):
+        size = entry.stat(follow_symlinks=False).st_size
+        return folders[bisect.bisect_right(SIZE_BOUNDS, size)]
+
+    return classify
+
+
+def nested_key(classifiers):
+    """Returns a classifier joining the folder names of the given
+    classifiers into one nested path. Levels a classifier can't name, such
+    as the extension of a file without one, are left out; the result is
+    None only if no level is left."""
+
+    def classify(entry):
+        names = [name for name in (key(entry) for key in classifiers) if name]
+        return os.path.join(*names) if names else None
+
+    return classify
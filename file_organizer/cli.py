@@ -1,154 +1,437 @@
 # file_organizer/cli.py
+import ctypes
+import errno
+import functools
+import os
+import shutil
+import sys
 import typer
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from rich.console import Console
-from datetime import datetime
+from typing import Callable, Optional
+
+from file_organizer._classify import date_key, ext_key, nested_key, size_key
 
 app = typer.Typer()
-console = Console()
 
 
-def organize_by_extension(
-    path: Path,
-    dry_run: bool = False,
-    recursive: bool = False,
-    ext_template: str = "{ext}",
-):
-    """Organizes files in the given path by their extension."""
-    console.print(
-        f"\n[bold cyan]Organizing {path} by file extension...[/bold cyan]"
-    )
+@functools.lru_cache(maxsize=None)
+def _console():
+    """Returns the shared console, importing rich only on first use so runs
+    that print nothing don't pay for it."""
+    from rich.console import Console
+
+    return Console()
+
+
+_MAX_WORKERS = (os.cpu_count() or 1) * 2
+# Entries stat'ed per worker task when prefetching file metadata.
+_STAT_BATCH = 128
+
+_AT_FDCWD = -100
+_RENAME_NOREPLACE = 1
+
+
+def _load_renameat2():
+    """Returns libc's renameat2 on Linux, or None where it is unavailable."""
+    if sys.platform != "linux":
+        return None
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    renameat2.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_uint,
+    ]
+    renameat2.restype = ctypes.c_int
+    return renameat2
+
+
+_renameat2 = _load_renameat2()
+
+
+def _list_dir(path, stat: bool = False):
+    """Returns the entries of a directory, or none if it can't be read.
+
+    With stat set, the metadata of every non-directory entry is fetched
+    along with the listing, so it is already cached when the entries are
+    classified.
+    """
+    try:
+        with os.scandir(path) as entries:
+            entries = list(entries)
+    except OSError:
+        return []
+    if stat:
+        _stat_batch(
+            [
+                entry
+                for entry in entries
+                if not entry.is_dir(follow_symlinks=False)
+            ]
+        )
+    return entries
+
+
+def _walk_parallel(root, stat: bool = False):
+    """Yields the entries of root and all of its subdirectories (without
+    following symlinks), reading directories concurrently on a thread pool.
+
+    Entries are yielded as each directory listing completes, so their order
+    is not deterministic.
+    """
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+        pending = {pool.submit(_list_dir, root, stat)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for entry in future.result():
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.add(pool.submit(_list_dir, entry.path, stat))
+                    yield entry
+
+
+def _scan(path: str, recursive: bool = False, stat: bool = False):
+    """Yields the directory entries of path, descending into subdirectories
+    when recursive is set.
+
+    Recursive scans stat files as they are listed when stat is set; other
+    callers can use _prefetch_stats() on the entries they keep.
+    """
+    if recursive:
+        yield from _walk_parallel(path, stat)
+        return
+    with os.scandir(path) as entries:
+        yield from entries
 
-    items = path.rglob("*") if recursive else path.iterdir()
-    for item in items:
-        if not item.is_file() or item.name.startswith("."):
-            continue
 
-        extension = item.suffix.lower()
-        if not extension:
-            console.print(
-                f"[yellow]Skipping '{item.name}' (no extension)[/yellow]"
+def _rename_noreplace(src: str, dst: str):
+    """Renames src to dst, raising FileExistsError instead of overwriting an
+    existing destination."""
+    if _renameat2 is not None:
+        if not _renameat2(
+            _AT_FDCWD,
+            os.fsencode(src),
+            _AT_FDCWD,
+            os.fsencode(dst),
+            _RENAME_NOREPLACE,
+        ):
+            return
+        err = ctypes.get_errno()
+        # Kernels or filesystems without RENAME_NOREPLACE support fall back
+        # to the check-then-rename path below.
+        if err not in (errno.EINVAL, errno.ENOSYS):
+            raise OSError(err, os.strerror(err), dst)
+    # os.rename already refuses to replace an existing file on Windows, so
+    # the extra attribute lookup is only needed on POSIX systems.
+    if sys.platform != "win32" and os.path.lexists(dst):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+    os.rename(src, dst)
+
+
+def _rename(op):
+    """Renames a (source, destination) pair, returning the error if any.
+    Pairs that turn out to span filesystems are copied instead."""
+    try:
+        _rename_noreplace(*op)
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            return _copy_move(op)
+        return e
+    except Exception as e:
+        return e
+    return None
+
+
+def _copy_move(op):
+    """Moves a (source, destination) pair that spans filesystems by copying
+    it, returning the error if any. Existing files are never overwritten."""
+    src, dst = op
+    try:
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+        shutil.move(src, dst)
+    except Exception as e:
+        return e
+    return None
+
+
+def _rename_all(ops):
+    """Renames (source, destination) pairs concurrently and returns the
+    error for each pair in order, or None where the move succeeded."""
+    if not ops:
+        return []
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+        return list(pool.map(_rename, ops))
+
+
+def _flush(lines):
+    """Prints buffered messages with a single console call."""
+    if lines:
+        _console().print("\n".join(lines))
+
+
+def _stat_batch(entries):
+    """Populates the stat cache of each entry, ignoring failures."""
+    for entry in entries:
+        try:
+            entry.stat(follow_symlinks=False)
+        except OSError:
+            pass
+
+
+def _prefetch_stats(entries):
+    """Stats the given entries concurrently in batches so that later
+    entry.stat() calls are served from each DirEntry's cache.
+
+    Skipped on Windows, where os.scandir already returns the metadata with
+    the directory listing, and for listings too small to be worth a pool.
+    """
+    if sys.platform == "win32" or len(entries) <= _STAT_BATCH:
+        return
+    batches = [
+        entries[i : i + _STAT_BATCH]  # noqa: E203
+        for i in range(0, len(entries), _STAT_BATCH)
+    ]
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+        list(pool.map(_stat_batch, batches))
+
+
+def _collect_files(path: str, recursive: bool, stat: bool):
+    """Scans path for the visible regular files to organize.
+
+    Returns the file entries and, for recursive scans, the set of
+    subdirectories that live on another device than path.
+    """
+    # Files below a mount point can't be renamed into path. Recursive scans
+    # note which directories live on another device (one stat each) so
+    # their files can be copied instead of failing one rename at a time.
+    # DirEntry.stat() reports st_dev as 0 on Windows, so the check is
+    # skipped there and EXDEV renames fall back to copying in _rename().
+    check_dev = recursive and sys.platform != "win32"
+    src_dev = os.stat(path).st_dev if check_dev else None
+    foreign_dirs = set()
+    files = []
+    for entry in _scan(path, recursive, stat):
+        # DirEntry answers type checks from the d_type returned by readdir.
+        # Only on filesystems reporting DT_UNKNOWN does the first check cost
+        # an lstat, which the entry then caches for later checks and stat().
+        # Files, the common case, are settled by a single check.
+        if entry.is_file(follow_symlinks=False):
+            if entry.name[:1] != ".":
+                files.append(entry)
+        elif check_dev and entry.is_dir(follow_symlinks=False):
+            if entry.stat(follow_symlinks=False).st_dev != src_dev:
+                foreign_dirs.add(entry.path)
+    return files, foreign_dirs
+
+
+def _apply_moves(path: str, moves, foreign_dirs, quiet: bool, out):
+    """Moves each (entry, dest_dir_name) pair into its folder under path,
+    appending the outcome messages to out.
+
+    Files in foreign_dirs are copied after the concurrent renames.
+    """
+    same_dev, cross_dev = [], []
+    for move in moves:
+        in_foreign_dir = os.path.dirname(move[0].path) in foreign_dirs
+        (cross_dev if in_foreign_dir else same_dev).append(move)
+    if cross_dev and not quiet:
+        out.append(
+            f"[yellow]{len(cross_dev)} file(s) are on another filesystem "
+            "and will be copied instead of renamed.[/yellow]"
+        )
+
+    def ops(batch):
+        return [
+            (entry.path, os.path.join(path, dest_dir_name, entry.name))
+            for entry, dest_dir_name in batch
+        ]
+
+    errors = _rename_all(ops(same_dev))
+    errors += [_copy_move(op) for op in ops(cross_dev)]
+    for (entry, dest_dir_name), error in zip(same_dev + cross_dev, errors):
+        if error is not None:
+            out.append(
+                f"[bold red]Error moving '{entry.name}': {error}[/bold red]"
             )
+        elif not quiet:
+            out.append(
+                f"[green]Moved '{entry.name}' to '{dest_dir_name}/'[/green]"
+            )
+
+
+def _plan_moves(path: str, files, classify, dry_run: bool, quiet: bool, out):
+    """Classifies files into (entry, dest_dir_name) moves, appending skip,
+    dry-run and conflict messages to out."""
+    moves = []
+    claimed = set()
+    for entry in files:
+        dest_dir_name = classify(entry)
+        if dest_dir_name is None:
+            if not quiet:
+                out.append(
+                    f"[yellow]Skipping '{entry.name}' (no extension)[/yellow]"
+                )
             continue
 
-        dest_dir_name = ext_template.format(ext=extension[1:])
-        dest_dir = path / dest_dir_name
+        # Files already in place, e.g. seen again by a recursive rerun,
+        # have nothing to do; renaming them onto themselves would fail.
+        dest_path = os.path.join(path, dest_dir_name, entry.name)
+        if entry.path == dest_path:
+            continue
 
-        if dry_run:
-            console.print(
-                f"[yellow][DRY RUN] Would move '{item.name}' to "
-                f"'{dest_dir.name}/'[/yellow]"
+        # The renames run concurrently, so two files bound for the same
+        # destination could both pass the no-overwrite check. Only the
+        # first one is dispatched; the others are reported here.
+        if dest_path in claimed:
+            out.append(
+                f"[bold red]Error moving '{entry.name}': another file is "
+                f"already moving to '{dest_dir_name}/'[/bold red]"
             )
             continue
+        claimed.add(dest_path)
 
-        dest_dir.mkdir(exist_ok=True)
-        try:
-            dest_path = dest_dir / item.name
-            item.rename(dest_path)
-            console.print(
-                f"[green]Moved '{item.name}' to '{dest_dir.name}/'[/green]"
-            )
-        except Exception as e:  # noqa: F841
-            console.print(
-                f"[bold red]Error moving '{item.name}': {{e}}[/bold red]"
-            )
+        if dry_run:
+            if not quiet:
+                out.append(
+                    f"[yellow][DRY RUN] Would move '{entry.name}' to "
+                    f"'{dest_dir_name}/'[/yellow]"
+                )
+            continue
 
+        moves.append((entry, dest_dir_name))
+    return moves
 
-def organize_by_date(
-    path: Path,
+
+def _organize(
+    path: str,
+    classify: Callable[[os.DirEntry], Optional[str]],
+    description: str,
     dry_run: bool = False,
     recursive: bool = False,
-    date_template: str = "{YYYY}-{MM}-{DD}",
+    quiet: bool = False,
+    needs_stat: bool = False,
 ):
-    """Organizes files in the given path by their modification date."""
-    console.print(f"\n[bold cyan]Organizing {path} by date...[/bold cyan]")
+    """Moves every visible file in path into the folder named by
+    classify(entry), skipping files it returns None for.
 
-    items = path.rglob("*") if recursive else path.iterdir()
-    for item in items:
-        if not item.is_file() or item.name.startswith("."):
-            continue
-
-        m_time = item.stat().st_mtime
-        dt_object = datetime.fromtimestamp(m_time)
-        dest_dir_name = date_template.format(
-            YYYY=dt_object.year,
-            MM=f"{dt_object.month:02}",
-            DD=f"{dt_object.day:02}",
+    needs_stat marks classifiers that read entry.stat(), so the metadata
+    can be fetched concurrently before classification.
+    """
+    if not quiet:
+        _console().print(
+            f"\n[bold cyan]Organizing {path} {description}...[/bold cyan]"
         )
-        dest_dir = path / dest_dir_name
 
-        if dry_run:
-            console.print(
-                f"[yellow][DRY RUN] Would move '{item.name}' to "
-                f"'{dest_dir.name}/'[/yellow]"
-            )
-            continue
+    files, foreign_dirs = _collect_files(path, recursive, needs_stat)
+    if needs_stat and not recursive:
+        _prefetch_stats(files)
 
-        dest_dir.mkdir(exist_ok=True)
-        try:
-            dest_path = dest_dir / item.name
-            item.rename(dest_path)
-            console.print(
-                f"[green]Moved '{item.name}' to '{dest_dir.name}/'[/green]"
-            )
-        except Exception as e:  # noqa: F841
-            console.print(
-                f"[bold red]Error moving '{item.name}': {{e}}[/bold red]"
-            )
+    out = []
+    moves = _plan_moves(path, files, classify, dry_run, quiet, out)
+
+    # Issue the renames grouped by destination so consecutive moves hit the
+    # same directory; the sort is stable, keeping scan order within each.
+    moves.sort(key=lambda move: move[1])
+
+    # Create each destination once up front rather than once per file.
+    for dest_dir_name in sorted({name for _, name in moves}):
+        os.makedirs(os.path.join(path, dest_dir_name), exist_ok=True)
+
+    _apply_moves(path, moves, foreign_dirs, quiet, out)
+    _flush(out)
+
+
+def organize_by_extension(
+    path: str,
+    dry_run: bool = False,
+    recursive: bool = False,
+    ext_template: str = "{ext}",
+    quiet: bool = False,
+):
+    """Organizes files in the given path by their extension."""
+    _organize(
+        path,
+        ext_key(ext_template),
+        "by file extension",
+        dry_run,
+        recursive,
+        quiet,
+    )
+
+
+def organize_by_date(
+    path: str,
+    dry_run: bool = False,
+    recursive: bool = False,
+    date_template: str = "{YYYY}-{MM}-{DD}",
+    quiet: bool = False,
+):
+    """Organizes files in the given path by their modification date."""
+    _organize(
+        path,
+        date_key(date_template),
+        "by date",
+        dry_run,
+        recursive,
+        quiet,
+        needs_stat=True,
+    )
 
 
 def organize_by_size(
-    path: Path,
+    path: str,
     dry_run: bool = False,
     recursive: bool = False,
     size_template: str = "{size}",
+    quiet: bool = False,
 ):
     """Organizes files in the given path by their size."""
-    console.print(
-        f"\n[bold cyan]Organizing {path} by file size...[/bold cyan]"
+    _organize(
+        path,
+        size_key(size_template),
+        "by file size",
+        dry_run,
+        recursive,
+        quiet,
+        needs_stat=True,
     )
 
-    size_map = {
-        "Tiny": (0, 1_024),  # < 1 KB
-        "Small": (1_024, 1_048_576),  # 1 KB - 1 MB
-        "Medium": (1_048_576, 134_217_728),  # 1 MB - 128 MB
-        "Large": (134_217_728, 1_073_741_824),  # 128 MB - 1 GB
-        "Huge": (1_073_741_824, float("inf")),  # > 1 GB
-    }
-
-    items = path.rglob("*") if recursive else path.iterdir()
-    for item in items:
-        if not item.is_file() or item.name.startswith("."):
-            continue
 
-        size = item.stat().st_size
-        dest_folder_name = "Unknown"
-        for name, (min_size, max_size) in size_map.items():
-            if min_size <= size < max_size:
-                dest_folder_name = name
-                break
-
-        dest_dir_name = size_template.format(size=dest_folder_name)
-        dest_dir = path / dest_dir_name
-
-        if dry_run:
-            console.print(
-                f"[yellow][DRY RUN] Would move '{item.name}' to "
-                f"'{dest_dir.name}/'[/yellow]"
-            )
-            continue
+def _organize_combined(
+    path: str,
+    dry_run: bool = False,
+    recursive: bool = False,
+    quiet: bool = False,
+    ext_template: Optional[str] = None,
+    date_template: Optional[str] = None,
+    size_template: Optional[str] = None,
+):
+    """Organizes files in the given path into nested folders, one level for
+    each template given (extension, then date, then size), in a single pass
+    over the directory."""
+    modes = []
+    if ext_template is not None:
+        modes.append(("file extension", ext_key(ext_template)))
+    if date_template is not None:
+        modes.append(("date", date_key(date_template)))
+    if size_template is not None:
+        modes.append(("file size", size_key(size_template)))
 
-        dest_dir.mkdir(exist_ok=True)
-        try:
-            dest_path = dest_dir / item.name
-            item.rename(dest_path)
-            console.print(
-                f"[green]Moved '{item.name}' to '{dest_dir.name}/'[/green]"
-            )
-        except Exception as e:  # noqa: F841
-            console.print(
-                f"[bold red]Error moving '{item.name}': {{e}}[/bold red]"
-            )
+    _organize(
+        path,
+        nested_key([key for _, key in modes]),
+        "by " + ", ".join(label for label, _ in modes),
+        dry_run,
+        recursive,
+        quiet,
+        needs_stat=date_template is not None or size_template is not None,
+    )
 
 
 @app.command()
@@ -195,27 +478,49 @@ def main(
         "--dry-run",
         help="Show what changes would be made without moving files.",
     ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Only report errors instead of every file moved.",
+    ),
 ):
     """
     A powerful and configurable CLI tool to organize your files effortlessly.
     """
-    if not any([by_extension, by_date, by_size]):
-        console.print(
+    if not (by_extension or by_date or by_size):
+        _console().print(
             "[bold yellow]No organization mode selected. "
             "Please specify an option like --by-extension, --by-date, "
             "or --by-size.[/bold yellow]"
         )
         raise typer.Exit()
 
-    if by_extension:
-        organize_by_extension(path, dry_run, recursive, ext_template)
-    if by_date:
-        organize_by_date(path, dry_run, recursive, date_template)
-    if by_size:
-        organize_by_size(path, dry_run, recursive, size_template)
+    # Typer validates and resolves the argument as a Path; the organizers
+    # work on plain strings so no Path objects are built per file.
+    path = os.fspath(path)
 
-    if not dry_run:
-        console.print("\n[bold green]✨ Organization complete! ✨[/bold green]")
+    if by_extension + by_date + by_size > 1:
+        _organize_combined(
+            path,
+            dry_run,
+            recursive,
+            quiet,
+            ext_template if by_extension else None,
+            date_template if by_date else None,
+            size_template if by_size else None,
+        )
+    elif by_extension:
+        organize_by_extension(path, dry_run, recursive, ext_template, quiet)
+    elif by_date:
+        organize_by_date(path, dry_run, recursive, date_template, quiet)
+    else:
+        organize_by_size(path, dry_run, recursive, size_template, quiet)
+
+    if not (dry_run or quiet):
+        _console().print(
+            "\n[bold green]✨ Organization complete! ✨[/bold green]"
+        )
 
 
 if __name__ == "__main__":
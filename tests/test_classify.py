@@ -0,0 +1,37 @@
+# tests/test_classify.py
+import os
+from datetime import datetime
+
+import pytest
+
+from file_organizer._classify import date_key
+
+TIMESTAMPS = [0.0, 86_399.5, 951_782_400.0, 1_577_923_200.0, 1_790_000_000.0]
+
+
+class FakeEntry:
+    def __init__(self, m_time):
+        self.m_time = m_time
+
+    def stat(self, follow_symlinks=True):
+        return os.stat_result((0, 0, 0, 0, 0, 0, 0, 0, self.m_time, 0))
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{YYYY}-{MM}-{DD}",
+        "{YYYY}/{MM}",
+        "100%_{YYYY}%m",
+        "{YYYY:>6}-{MM}",
+        "{{literal}}-{DD}",
+    ],
+)
+def test_date_key_matches_str_format(template):
+    classify = date_key(template)
+    for m_time in TIMESTAMPS:
+        dt = datetime.fromtimestamp(m_time)
+        expected = template.format(
+            YYYY=dt.year, MM=f"{dt.month:02}", DD=f"{dt.day:02}"
+        )
+        assert classify(FakeEntry(m_time)) == expected
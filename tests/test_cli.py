@@ -0,0 +1,149 @@
+# tests/test_cli.py
+import errno
+import os
+import time
+
+from typer.testing import CliRunner
+
+from file_organizer import cli
+from file_organizer.cli import app
+
+runner = CliRunner()
+
+
+def test_recursive_rerun_leaves_sorted_files_alone(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.pdf").write_text("b")
+
+    first = runner.invoke(app, [str(tmp_path), "-e", "-r"])
+    second = runner.invoke(app, [str(tmp_path), "-e", "-r"])
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert "Error" not in second.output
+    assert (tmp_path / "txt" / "a.txt").read_text() == "a"
+    assert (tmp_path / "pdf" / "b.pdf").read_text() == "b"
+
+
+def test_existing_destination_is_not_overwritten(tmp_path):
+    (tmp_path / "a.txt").write_text("new")
+    (tmp_path / "txt").mkdir()
+    (tmp_path / "txt" / "a.txt").write_text("old")
+
+    result = runner.invoke(app, [str(tmp_path), "-e"])
+
+    assert result.exit_code == 0
+    assert "Error moving 'a.txt'" in result.output
+    assert (tmp_path / "a.txt").read_text() == "new"
+    assert (tmp_path / "txt" / "a.txt").read_text() == "old"
+
+
+def test_duplicate_destinations_lose_no_files(tmp_path, monkeypatch):
+    lexists = os.path.lexists
+
+    def slow_lexists(path):
+        # Widen the window between the existence check and the rename.
+        found = lexists(path)
+        time.sleep(0.05)
+        return found
+
+    monkeypatch.setattr(cli, "_renameat2", None)
+    monkeypatch.setattr(os.path, "lexists", slow_lexists)
+    for i in range(8):
+        (tmp_path / f"sub{i}").mkdir()
+        (tmp_path / f"sub{i}" / "a.txt").write_text(str(i))
+
+    result = runner.invoke(app, [str(tmp_path), "-e", "-r"])
+
+    assert result.exit_code == 0
+    assert result.output.count("Moved 'a.txt'") == 1
+    assert result.output.count("Error moving 'a.txt'") == 7
+    contents = {p.read_text() for p in tmp_path.rglob("a.txt")}
+    assert contents == {str(i) for i in range(8)}
+
+
+def test_combined_modes_drop_missing_extension_level(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "README").write_text("r")
+
+    result = runner.invoke(app, [str(tmp_path), "-e", "-s"])
+
+    assert result.exit_code == 0
+    assert (tmp_path / "txt" / "Tiny" / "a.txt").exists()
+    assert (tmp_path / "Tiny" / "README").exists()
+
+
+def test_cross_device_rename_falls_back_to_copy(tmp_path, monkeypatch):
+    def fail_with_exdev(src, dst):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV), dst)
+
+    monkeypatch.setattr(cli, "_rename_noreplace", fail_with_exdev)
+    (tmp_path / "a.txt").write_text("a")
+
+    result = runner.invoke(app, [str(tmp_path), "-e"])
+
+    assert result.exit_code == 0
+    assert "Error" not in result.output
+    assert not (tmp_path / "a.txt").exists()
+    assert (tmp_path / "txt" / "a.txt").read_text() == "a"
+
+
+def test_cross_device_duplicates_lose_no_files(tmp_path, monkeypatch):
+    lexists = os.path.lexists
+
+    def fail_with_exdev(src, dst):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV), dst)
+
+    def slow_lexists(path):
+        found = lexists(path)
+        time.sleep(0.05)
+        return found
+
+    monkeypatch.setattr(cli, "_rename_noreplace", fail_with_exdev)
+    monkeypatch.setattr(os.path, "lexists", slow_lexists)
+    for i in range(4):
+        (tmp_path / f"sub{i}").mkdir()
+        (tmp_path / f"sub{i}" / "a.txt").write_text(str(i))
+
+    result = runner.invoke(app, [str(tmp_path), "-e", "-r"])
+
+    assert result.exit_code == 0
+    assert result.output.count("Moved 'a.txt'") == 1
+    contents = {p.read_text() for p in tmp_path.rglob("a.txt")}
+    assert contents == {str(i) for i in range(4)}
+
+
+def test_file_path_is_rejected(tmp_path, monkeypatch):
+    # Relative names keep the error message short enough not to wrap.
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.txt").write_text("a")
+
+    result = runner.invoke(app, ["a.txt", "-e"])
+
+    assert result.exit_code == 2
+    assert "is a file" in result.output
+
+
+def test_missing_path_is_rejected(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(app, ["missing", "-e"])
+
+    assert result.exit_code == 2
+    assert "does not exist" in result.output
+
+
+def test_quiet_reports_only_errors(tmp_path):
+    (tmp_path / "a.txt").write_text("new")
+    (tmp_path / "b.txt").write_text("b")
+    (tmp_path / "txt").mkdir()
+    (tmp_path / "txt" / "a.txt").write_text("old")
+
+    result = runner.invoke(app, [str(tmp_path), "-e", "-q"])
+
+    assert result.exit_code == 0
+    assert "Organizing" not in result.output
+    assert "Moved" not in result.output
+    assert "Organization complete" not in result.output
+    assert "Error moving 'a.txt'" in result.output
+    assert (tmp_path / "txt" / "b.txt").exists()